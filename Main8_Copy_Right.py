@@ -20,12 +20,18 @@ and management of company documentation.
 import os
 import shutil
 import docx
+from lxml import etree
 import urllib.parse
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import PatternFill
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 from tkinter import filedialog, messagebox, simpledialog
 import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import logging
 import re
 from datetime import datetime
@@ -34,7 +40,15 @@ from reportlab.lib.pagesizes import A4
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from PyPDF2 import PdfReader, PdfWriter
+try:
+    import pikepdf
+    PIKEPDF_SUPPORT = True
+except ImportError:
+    PIKEPDF_SUPPORT = False
 import io
+import unicodedata
+import mmap
+import collections
 import sys
 import platform
 from reportlab.pdfbase.cidfonts import UnicodeCIDFont
@@ -47,15 +61,272 @@ except ImportError:
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+# Word XML namespace and the attribute that links a hyperlink to its relationship
+WORD_NAMESPACES = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
+RELATIONSHIP_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+
+# Row colors in the links report, one fill per column (None leaves the cell uncolored)
+_GREEN_FILL = PatternFill(start_color="92D050", end_color="92D050", fill_type="solid")
+_LIGHT_GREEN_FILL = PatternFill(start_color="E6FFE6", end_color="E6FFE6", fill_type="solid")
+_RED_FILL = PatternFill(start_color="FF6B6B", end_color="FF6B6B", fill_type="solid")
+STATUS_FILLS = {
+    "Found": (_LIGHT_GREEN_FILL, _LIGHT_GREEN_FILL, _LIGHT_GREEN_FILL, _GREEN_FILL),
+    "Missing": (None, None, None, _RED_FILL),
+}
+
+# Cover page text, only the trailing document number changes between covers
+COVER_PREFIX = "المستند رقم"
+# Shaped once, the number is then placed in front of it in visual (right-to-left) order
+COVER_PREFIX_BIDI = get_display(arabic_reshaper.reshape(COVER_PREFIX)) if ARABIC_SUPPORT else None
+# A page holding nothing but a cover, its text may come out in logical or visual (reversed) order
+COVER_PAGE_PATTERNS = [
+    re.compile(r"^\s*(\d*)\s*" + r"\s+".join(map(re.escape, prefix.split())) + r"\s*(\d*)\s*$")
+    for prefix in (COVER_PREFIX, COVER_PREFIX[::-1])
+]
+
+# Use a 1 MiB buffer when shutil can't use the OS zero-copy path
+shutil.COPY_BUFSIZE = 1024 * 1024
+
+# Copies are I/O-bound, so the thread pool can be larger than the core count
+COPY_MAX_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# PyPDF2 writes many small chunks per object, buffer them into fewer write calls
+PDF_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Name the Arabic font is registered under, None until register_arabic_fonts() succeeds
+ARABIC_FONT_NAME = None
+
+def register_arabic_fonts():
+    """Try to register Arabic fonts from system locations"""
+    global ARABIC_FONT_NAME
+    if ARABIC_FONT_NAME:
+        return True
+
+    # Potential Arabic font files grouped by directory based on OS
+    font_candidates = []
+
+    system = platform.system()
+    if system == 'Windows':
+        windows_font_dir = os.path.join(os.environ.get('SystemRoot', 'C:\\Windows'), 'Fonts')
+        font_candidates = [
+            (windows_font_dir, ['arial.ttf', 'tahoma.ttf', 'times.ttf', 'arabtype.ttf', 'simpo.ttf', 'simpfxo.ttf']),
+        ]
+    elif system == 'Darwin':  # macOS
+        font_candidates = [
+            ('/Library/Fonts', ['Arial.ttf', 'ArialHB.ttc']),
+            ('/System/Library/Fonts', ['Helvetica.ttc']),
+        ]
+    else:  # Linux
+        font_candidates = [
+            ('/usr/share/fonts/truetype/liberation', ['LiberationSans-Regular.ttf']),
+            ('/usr/share/fonts/truetype/freefont', ['FreeSans.ttf']),
+            ('/usr/share/fonts/TTF', ['DejaVuSans.ttf']),
+        ]
+
+    # Try to register fonts until one works
+    for font_dir, font_names in font_candidates:
+        # List each directory once instead of probing every candidate path
+        try:
+            with os.scandir(font_dir) as entries:
+                available = {entry.name.lower() for entry in entries}
+        except OSError:
+            continue
+
+        for font_name in font_names:
+            if font_name.lower() not in available:
+                continue
+            font_path = os.path.join(font_dir, font_name)
+            try:
+                pdfmetrics.registerFont(TTFont('Arabic', font_path))
+                logger.info("Registered font from %s", font_path)
+                ARABIC_FONT_NAME = 'Arabic'
+                return True
+            except Exception as e:
+                logger.warning("Failed to register font %s: %s", font_path, e)
+                continue
+
+    logger.warning("Could not register any Arabic fonts")
+    return False
+
+
+def build_cover_page(doc_number):
+    """Create a PDF cover page with 'المستند رقم' and the document number"""
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4)
+    width, height = A4
+
+    # Format the document number
+    formatted_number = f"{doc_number}"
+
+    # Text to display (المستند رقم + number)
+    arabic_text = f"{COVER_PREFIX} {formatted_number}"
+
+    # Try with Arabic reshaper and bidi algorithm if available
+    if ARABIC_SUPPORT and ARABIC_FONT_NAME:
+        try:
+            # Reuse the reshaped prefix, digits come first in visual order for RTL text
+            bidi_text = f"{formatted_number} {COVER_PREFIX_BIDI}"
+
+            # Use the registered font
+            c.setFont(ARABIC_FONT_NAME, 24)
+            # Center the text on the page
+            c.drawCentredString(width/2, height/2, bidi_text)
+
+            logger.info("Cover page created with Arabic reshaper")
+        except Exception as e:
+            logger.error("Error with Arabic reshaper: %s", e)
+            # Fall back to direct method
+            c.setFont("Helvetica-Bold", 36)
+            c.drawCentredString(width/2, height/2, formatted_number)
+    elif ARABIC_SUPPORT:
+        # No Arabic font was registered, so only the number can be drawn
+        c.setFont("Helvetica-Bold", 36)
+        c.drawCentredString(width/2, height/2, formatted_number)
+    else:
+        # If bidi/reshaper not available, try with basic RTL text
+        try:
+            # Use Times-Roman which might have better Arabic support
+            c.setFont("Times-Roman", 24)
+            # Try to use raw Arabic text - may not work in all systems
+            c.drawCentredString(width/2, height/2, arabic_text)
+        except:
+            # Last resort fallback
+            c.setFont("Helvetica-Bold", 36)
+            c.drawCentredString(width/2, height/2, formatted_number)
+
+    c.save()
+    buffer.seek(0)
+    return buffer
+
+
+def register_fonts():
+    """Register the Arabic font and the Times-Roman fallback used for cover pages"""
+    # Try to register Arabic fonts
+    register_arabic_fonts()
+
+    # Register Times-Roman as a fallback
+    try:
+        pdfmetrics.registerFont(UnicodeCIDFont('Times-Roman'))
+    except:
+        pass
+
+
+def read_cover_number(source_path):
+    """Return the document number on an existing cover page, or None if page 1 isn't a cover.
+
+    A cover whose number can't be read returns 0, which never matches a document number.
+    """
+    try:
+        with open(source_path, 'rb') as source_file, \
+                mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ) as source_map:
+            first_page_text = PdfReader(source_map).pages[0].extract_text() or ""
+    except Exception as e:
+        logger.warning("Could not read the first page of %s: %s", source_path, e)
+        return None
+
+    # NFKC folds the reshaped presentation forms back to plain letters
+    first_page_text = unicodedata.normalize("NFKC", first_page_text)
+    for pattern in COVER_PAGE_PATTERNS:
+        match = pattern.match(first_page_text)
+        if match:
+            number = match.group(1) or match.group(2)
+            return int(number) if number else 0
+    return None
+
+
+def merge_pdf(source_path, dest_path, doc_number, add_cover, skip_if_covered):
+    """Write a single PDF to its destination, adding a cover page if requested.
+
+    Runs inside a worker process, so it only takes plain picklable arguments.
+    """
+    try:
+        # Processed by an earlier run, don't stack a second cover on it
+        replace_cover = False
+        if add_cover and skip_if_covered:
+            cover_number = read_cover_number(source_path)
+            if cover_number == doc_number:
+                logger.info("Skipping cover page for %s, it already has cover %s", source_path, doc_number)
+                add_cover = False
+            elif cover_number is not None:
+                # The old cover shows another number, swap it for the new one
+                replace_cover = True
+        first_page = 1 if replace_cover else 0
+
+        if add_cover:
+            # Create and add cover page
+            cover_buffer = build_cover_page(doc_number)
+
+            if PIKEPDF_SUPPORT:
+                # Append the original pages to the cover without re-serializing them
+                # qpdf memory-maps the source itself instead of reading it into memory
+                with pikepdf.open(cover_buffer) as cover_pdf, \
+                        pikepdf.open(source_path, access_mode=pikepdf.AccessMode.mmap) as original_pdf:
+                    cover_pdf.pages.extend(original_pdf.pages[first_page:])
+                    # Pass streams and object streams through as they are instead of recompressing
+                    cover_pdf.save(
+                        dest_path,
+                        linearize=False,
+                        fix_metadata_version=False,
+                        compress_streams=False,
+                        stream_decode_level=pikepdf.StreamDecodeLevel.none,
+                        object_stream_mode=pikepdf.ObjectStreamMode.preserve,
+                    )
+            else:
+                # Merge cover page with original PDF
+                pdf_writer = PdfWriter()
+
+                # Add cover page
+                cover_reader = PdfReader(cover_buffer)
+                pdf_writer.add_page(cover_reader.pages[0])
+
+                # Map the source read-only, it must stay open until the writer is done
+                with open(source_path, 'rb') as source_file, \
+                        mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ) as source_map:
+                    # Add original PDF pages
+                    original_reader = PdfReader(source_map)
+                    for page in original_reader.pages[first_page:]:
+                        pdf_writer.add_page(page)
+
+                    # Write to destination
+                    with open(dest_path, 'wb', buffering=PDF_WRITE_BUFFER_SIZE) as output_file:
+                        pdf_writer.write(output_file)
+        else:
+            # Just copy the file if no cover page needed
+            shutil.copyfile(source_path, dest_path)
+    except Exception as e:
+        logger.error("Error processing %s: %s", source_path, e)
+        # Try to copy the original as fallback
+        try:
+            shutil.copyfile(source_path, dest_path)
+        except:
+            pass
+    return dest_path
+
+
+def merge_pdf_task(task):
+    """Unpack a (source_path, dest_path, doc_number, add_cover, skip_if_covered) tuple for executor.map"""
+    return merge_pdf(*task)
+
+
+def copy_file(source, destination):
+    """Copy a single file"""
+    try:
+        shutil.copyfile(source, destination)
+    except Exception as e:
+        logger.error("Error copying %s: %s", source, e)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
 class PDFExtractorApp:
+    # Compiled once and reused for every document
+    _HL_XPATH = etree.XPath("./w:p//w:hyperlink", namespaces=WORD_NAMESPACES)
+    _T_XPATH = etree.XPath(".//w:r/w:t", namespaces=WORD_NAMESPACES)
+
     def __init__(self, root):
         self.root = root
         self.root.title("PDF Extractor Tool - by Haytham Abo Abdallah")
-        self.root.geometry("650x600")
+        self.root.geometry("650x630")
         self.root.resizable(False, False)
         
         # Version info
@@ -72,67 +343,21 @@ class PDFExtractorApp:
         self.status_var = ttk.StringVar(value="Ready")
         self.enable_renaming = ttk.BooleanVar(value=True)
         self.add_cover_page = ttk.BooleanVar(value=True)
+        self.skip_if_already_covered = ttk.BooleanVar(value=False)
         
         # Store hyperlinks for functionality
         self.current_hyperlinks = []
-
-        # Try to register Arabic fonts
-        self.register_arabic_fonts()
         
-        # Register Times-Roman as a fallback
-        try:
-            pdfmetrics.registerFont(UnicodeCIDFont('Times-Roman'))
-        except:
-            pass
+        # ((path, modification time), hyperlinks) of the last extracted Word file,
+        # kept as one tuple so the extraction thread replaces it atomically
+        self._cached_docx_links = None
+
+        # Register the fonts used for cover pages
+        register_fonts()
 
         # UI Components
         self.create_widgets()
         
-    def register_arabic_fonts(self):
-        """Try to register Arabic fonts from system locations"""
-        # List of potential Arabic font locations based on OS
-        font_paths = []
-        
-        system = platform.system()
-        if system == 'Windows':
-            windows_font_dir = os.path.join(os.environ.get('SystemRoot', 'C:\\Windows'), 'Fonts')
-            font_paths = [
-                os.path.join(windows_font_dir, 'arial.ttf'),
-                os.path.join(windows_font_dir, 'tahoma.ttf'),
-                os.path.join(windows_font_dir, 'times.ttf'),
-                os.path.join(windows_font_dir, 'arabtype.ttf'),
-                os.path.join(windows_font_dir, 'simpo.ttf'),
-                os.path.join(windows_font_dir, 'simpfxo.ttf'),
-            ]
-        elif system == 'Darwin':  # macOS
-            font_paths = [
-                '/Library/Fonts/Arial.ttf',
-                '/Library/Fonts/ArialHB.ttc',
-                '/System/Library/Fonts/Helvetica.ttc',
-            ]
-        else:  # Linux
-            font_paths = [
-                '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',
-                '/usr/share/fonts/truetype/freefont/FreeSans.ttf',
-                '/usr/share/fonts/TTF/DejaVuSans.ttf',
-            ]
-        
-        # Try to register fonts until one works
-        for font_path in font_paths:
-            if os.path.exists(font_path):
-                try:
-                    pdfmetrics.registerFont(TTFont('Arabic', font_path))
-                    logging.info(f"Registered font from {font_path}")
-                    return True
-                except Exception as e:
-                    logging.warning(f"Failed to register font {font_path}: {e}")
-                    continue
-        
-        logging.warning("Could not register any Arabic fonts")
-        return False
-
-
-
     def create_widgets(self):
         """Create modern UI components"""
 
@@ -162,6 +387,8 @@ class PDFExtractorApp:
                       variable=self.enable_renaming, bootstyle="round-toggle").pack(anchor="w", pady=2)
         ttk.Checkbutton(options_frame, text="Add Cover Page", 
                       variable=self.add_cover_page, bootstyle="round-toggle").pack(anchor="w", pady=2)
+        ttk.Checkbutton(options_frame, text="Reuse Existing Cover Page (replace it if the number differs)", 
+                      variable=self.skip_if_already_covered, bootstyle="round-toggle").pack(anchor="w", pady=2)
 
         # Progress Bar
         self.progress = ttk.Progressbar(self.root, mode="determinate", bootstyle=INFO, length=500)
@@ -204,8 +431,12 @@ class PDFExtractorApp:
         file_path = filedialog.askopenfilename(filetypes=[("Word Files", "*.docx")])
         if file_path:
             self.word_file_path.set(file_path)
-            # Extract hyperlinks when file is selected
-            self.extract_links_from_word()
+            # Drop links cached for the previously selected file
+            self._cached_docx_links = None
+            # Extract hyperlinks in a separate thread to keep UI responsive
+            self.status_var.set("Extracting links from Word file...")
+            thread = threading.Thread(target=self.extract_links_from_word, args=(file_path,), daemon=True)
+            thread.start()
 
     def select_central_pdf_folder(self):
         """Open folder dialog to select the central PDF folder"""
@@ -219,27 +450,37 @@ class PDFExtractorApp:
         if folder_path:
             self.destination_folder.set(folder_path)
 
-    def extract_links_from_word(self):
-        """Extract links from the selected Word file"""
-        word_file_path = self.word_file_path.get()
+    def extract_links_from_word(self, word_file_path):
+        """Extract links from the selected Word file.
+
+        Runs in a worker thread, so Tk updates are scheduled on the main loop with root.after.
+        """
         if not word_file_path:
             return
 
         try:
-            self.status_var.set("Extracting links from Word file...")
-            self.root.update_idletasks()
-            
+            # Taken before parsing so a file saved mid-extraction isn't treated as cached
+            cache_key = self.get_docx_cache_key(word_file_path)
             doc = docx.Document(word_file_path)
-            self.current_hyperlinks = self.extract_hyperlinks(doc)
+            hyperlinks = self.extract_hyperlinks(doc)
+            self.current_hyperlinks = hyperlinks
+            self._cached_docx_links = (cache_key, hyperlinks)
             
-            if self.current_hyperlinks:
-                self.status_var.set(f"Found {len(self.current_hyperlinks)} PDF links in document")
+            if hyperlinks:
+                self.root.after(0, self.status_var.set, f"Found {len(hyperlinks)} PDF links in document")
             else:
-                self.status_var.set("No PDF links found in the document")
+                self.root.after(0, self.status_var.set, "No PDF links found in the document")
                 
         except Exception as e:
-            self.status_var.set("Error extracting links")
-            messagebox.showerror("Error", f"❌ Failed to extract links: {e}")
+            self.root.after(0, self.status_var.set, "Error extracting links")
+            self.root.after(0, messagebox.showerror, "Error", f"❌ Failed to extract links: {e}")
+
+    def get_docx_cache_key(self, word_file_path):
+        """Identify a Word file by path and modification time, None if it can't be read"""
+        try:
+            return (word_file_path, os.path.getmtime(word_file_path))
+        except OSError:
+            return None
 
     def start_processing(self):
         """Start the processing in a separate thread to keep UI responsive"""
@@ -256,17 +497,24 @@ class PDFExtractorApp:
             messagebox.showerror("Error", "⚠️ Please select all required paths.")
             return
 
-        try:
-            doc = docx.Document(word_file_path)
-        except Exception as e:
-            messagebox.showerror("Error", f"❌ Failed to load Word document: {e}")
-            return
+        # Reuse the links extracted on file selection if the file hasn't changed since
+        hyperlinks = None
+        cached = self._cached_docx_links
+        if cached and cached[0] and cached[1] and cached[0] == self.get_docx_cache_key(word_file_path):
+            hyperlinks = cached[1]
+        else:
+            try:
+                doc = docx.Document(word_file_path)
+            except Exception as e:
+                messagebox.showerror("Error", f"❌ Failed to load Word document: {e}")
+                return
 
         self.progress.start(10)
         self.status_var.set("Extracting hyperlinks...")
         self.root.update_idletasks()
 
-        hyperlinks = self.extract_hyperlinks(doc)
+        if hyperlinks is None:
+            hyperlinks = self.extract_hyperlinks(doc)
         if not hyperlinks:
             self.progress.stop()
             self.status_var.set("No PDF hyperlinks found")
@@ -338,242 +586,182 @@ class PDFExtractorApp:
     def extract_hyperlinks(self, doc):
         """Extracts PDF hyperlinks from a Word document."""
         hyperlinks = []
-        for para in doc.paragraphs:
-            for hyperlink in para._element.xpath(".//w:hyperlink"):
-                link_text = "".join(t.text for t in hyperlink.xpath(".//w:r/w:t")) or "Unnamed Link"
-                r_id = hyperlink.get("{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id")
-                if r_id and r_id in doc.part.rels:
-                    url = os.path.normpath(urllib.parse.unquote(doc.part.rels[r_id].target_ref.strip()))
-                    if url.lower().endswith(".pdf"):
-                        hyperlinks.append((link_text, url))
+        rels = doc.part.rels
+        # Single pass over the hyperlinks in the body's paragraphs
+        for hyperlink in self._HL_XPATH(doc.element.body):
+            r_id = hyperlink.get(RELATIONSHIP_ID)
+            if not r_id or r_id not in rels:
+                continue
+            
+            # Skip non-PDF targets before doing any decoding or text joining
+            target_ref = rels[r_id].target_ref
+            if not target_ref.rstrip().lower().endswith(".pdf"):
+                continue
+            
+            url = os.path.normpath(urllib.parse.unquote(target_ref.strip()))
+            link_text = "".join([t.text for t in self._T_XPATH(hyperlink) if t.text is not None]) or "Unnamed Link"
+            hyperlinks.append((link_text, url))
         return hyperlinks
 
+    def _assign_doc_numbers(self, existing_pdfs):
+        """Number unique PDF filenames from 1 in first-seen order, shared by the PDFs and the report"""
+        unique_filenames = dict.fromkeys(os.path.basename(url) for _, url in existing_pdfs)
+        return {filename: number for number, filename in enumerate(unique_filenames, start=1)}
+
     def save_links_to_xlsx(self, all_hyperlinks, existing_pdfs, missing_pdfs, xlsx_file_path, destination_folder):
         """Saves extracted hyperlinks to an XLSX file with status and document numbers."""
-        workbook = openpyxl.Workbook()
+        # Write-only workbook streams rows out instead of keeping every cell in memory
+        workbook = openpyxl.Workbook(write_only=True)
         
         # Create All Links sheet
-        sheet1 = workbook.active
-        sheet1.title = "All Links"
+        sheet1 = workbook.create_sheet("All Links")
         
-        # Set column headers
-        sheet1.append(["Link Text", "PDF Link", "Document Number", "Status"])
+        # Column headers
+        headers = ["Link Text", "PDF Link", "Document Number", "Status"]
         
-        # Create a dictionary for quick lookup of status
-        existing_dict = {url: "Found" for _, url in existing_pdfs}
-        missing_dict = {url: "Missing" for _, url in missing_pdfs}
+        # Sets for quick lookup of status
+        existing_set = {url for _, url in existing_pdfs}
+        missing_set = {url for _, url in missing_pdfs}
         
-        # Track unique filenames to prevent duplicate document numbers
-        unique_filenames = {}
-        doc_number_counter = 1
-        
-        # First pass: identify unique filenames
-        for _, url in existing_pdfs:
-            filename = os.path.basename(url)
-            if filename not in unique_filenames:
-                unique_filenames[filename] = doc_number_counter
-                doc_number_counter += 1
-                
-        # Create dictionaries for document numbers and renamed files
-        doc_number_dict = {}
-        renamed_files = {}
+        # Same numbering as process_pdfs, so the links match the renamed files
+        unique_filenames = self._assign_doc_numbers(existing_pdfs)
         
+        # Document number and renamed file for each found link
+        pdf_info = {}
         for _, url in existing_pdfs:
             filename = os.path.basename(url)
             doc_number = unique_filenames[filename]
-            doc_number_dict[url] = f"المستند رقم {doc_number:03d}"
             
             # Create the renamed filename as used in process_pdfs
-            new_name = f"المستند رقم {doc_number:03d} - {filename}"
-            renamed_files[url] = new_name
+            pdf_info[url] = (f"المستند رقم {doc_number:03d}", f"المستند رقم {doc_number:03d} - {filename}")
         
-        # Add all links with status and document number
+        # Collect rows and column widths in one pass, write-only sheets need widths before the first row
+        rows = []
+        column_widths = [len(header) for header in headers]
         for link_text, url in all_hyperlinks:
-            status = existing_dict.get(url, missing_dict.get(url, "Unknown"))
-            doc_number = doc_number_dict.get(url, "")
+            if url in existing_set:
+                status = "Found"
+            elif url in missing_set:
+                status = "Missing"
+            else:
+                status = "Unknown"
+            doc_number, new_filename = pdf_info.get(url, ("", None))
             filename = os.path.basename(url)
             
-            # Add the row
-            sheet1.append([link_text, filename, doc_number, status])
+            values = [link_text, filename, doc_number, status]
+            rows.append((values, status, new_filename))
+            column_widths = [max(width, len(str(value))) for width, value in zip(column_widths, values)]
+        
+        # Auto-adjust column widths
+        for col, max_length in enumerate(column_widths, start=1):
+            column_letter = openpyxl.utils.get_column_letter(col)
+            sheet1.column_dimensions[column_letter].width = (max_length + 2) * 1.2
+        
+        sheet1.append(headers)
+        
+        # Add all links with status, document number and colors set inline
+        for values, status, new_filename in rows:
+            cells = [WriteOnlyCell(sheet1, value=value) for value in values]
             
-            # Make the URL in the second column clickable to the destination file
             if status == "Found":
-                cell = sheet1.cell(row=sheet1.max_row, column=2)
-                new_filename = renamed_files.get(url, filename)
-                # Create local file:// hyperlink to the destination folder
+                # Make the URL in the second column clickable to the destination file
                 local_path = os.path.abspath(os.path.join(destination_folder, new_filename))
-                cell.hyperlink = f"file:///{local_path.replace('\\', '/')}"
-                cell.style = "Hyperlink"
+                cells[1].hyperlink = "file:///" + local_path.replace("\\", "/")
+                cells[1].style = "Hyperlink"
             
-        # Add conditional formatting for status column
-        from openpyxl.styles import PatternFill
-        green_fill = PatternFill(start_color="92D050", end_color="92D050", fill_type="solid")
-        red_fill = PatternFill(start_color="FF6B6B", end_color="FF6B6B", fill_type="solid")
-        
-        # Apply color to all cells in each row
-        for row in range(2, sheet1.max_row + 1):
-            status = sheet1.cell(row=row, column=4).value
-            if status == "Found":
-                for col in range(1, 5):  # Color all four columns
-                    cell = sheet1.cell(row=row, column=col)
-                    if col == 4:  # Status column
-                        cell.fill = green_fill
-                    else:
-                        cell.fill = PatternFill(start_color="E6FFE6", end_color="E6FFE6", fill_type="solid")  # Light green
-            elif status == "Missing":
-                sheet1.cell(row=row, column=4).fill = red_fill
-                
-        # Auto-adjust column widths
-        for column in sheet1.columns:
-            max_length = 0
-            column_letter = openpyxl.utils.get_column_letter(column[0].column)
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = (max_length + 2) * 1.2
-            sheet1.column_dimensions[column_letter].width = adjusted_width
+            # Color the row by status, after the hyperlink style so the fill isn't reset
+            for cell, fill in zip(cells, STATUS_FILLS.get(status, ())):
+                if fill is not None:
+                    cell.fill = fill
+            
+            sheet1.append(cells)
                 
         workbook.save(xlsx_file_path)
 
-    def create_cover_page(self, doc_number, link_text, pdf_filename):
-        """Create a PDF cover page with 'المستند رقم' and the document number"""
-        buffer = io.BytesIO()
-        c = canvas.Canvas(buffer, pagesize=A4)
-        width, height = A4
-        
-        # Format the document number
-        formatted_number = f"{doc_number}"
-        
-        # Text to display (المستند رقم + number)
-        arabic_text = f"المستند رقم {formatted_number}"
-        
-        # Try with Arabic reshaper and bidi algorithm if available
-        if ARABIC_SUPPORT:
-            try:
-                # Reshape the Arabic text
-                reshaped_text = arabic_reshaper.reshape(arabic_text)
-                # Apply bidirectional algorithm
-                bidi_text = get_display(reshaped_text)
-                
-                # Use a registered font
-                c.setFont("Arabic", 24)
-                # Center the text on the page
-                c.drawCentredString(width/2, height/2, bidi_text)
-                
-                logging.info("Cover page created with Arabic reshaper")
-            except Exception as e:
-                logging.error(f"Error with Arabic reshaper: {e}")
-                # Fall back to direct method
-                c.setFont("Helvetica-Bold", 36)
-                c.drawCentredString(width/2, height/2, formatted_number)
-        else:
-            # If bidi/reshaper not available, try with basic RTL text
-            try:
-                # Use Times-Roman which might have better Arabic support
-                c.setFont("Times-Roman", 24)
-                # Try to use raw Arabic text - may not work in all systems
-                c.drawCentredString(width/2, height/2, arabic_text)
-            except:
-                # Last resort fallback
-                c.setFont("Helvetica-Bold", 36)
-                c.drawCentredString(width/2, height/2, formatted_number)
-        
-        c.save()
-        buffer.seek(0)
-        return buffer
-
     def process_pdfs(self, existing_pdfs, central_pdf_folder, destination_folder):
         """Process PDFs - rename and add cover page as needed"""
         os.makedirs(destination_folder, exist_ok=True)
         
-        # Track unique filenames to prevent duplicate document numbers
-        unique_filenames = {}
-        doc_number_counter = 1
-        
-        # First identify unique filenames and assign document numbers
-        for _, pdf_filename in existing_pdfs:
-            filename = os.path.basename(pdf_filename)
-            if filename not in unique_filenames:
-                unique_filenames[filename] = doc_number_counter
-                doc_number_counter += 1
-        
-        total_files = len(existing_pdfs)
-        processed_count = 0
+        # One document number per unique filename
+        unique_filenames = self._assign_doc_numbers(existing_pdfs)
         
+        # Group references by filename, every reference to a file shares one destination
+        groups = collections.defaultdict(list)
         for link_text, pdf_filename in existing_pdfs:
-            filename = os.path.basename(pdf_filename)
+            groups[os.path.basename(pdf_filename)].append(link_text)
+        
+        # Build the task list up front so numbering stays deterministic across workers
+        add_cover = self.add_cover_page.get()
+        skip_if_covered = self.skip_if_already_covered.get()
+        enable_renaming = self.enable_renaming.get()
+        tasks = []
+        group_sizes = []
+        for filename, link_texts in groups.items():
             doc_number = unique_filenames[filename]
             source_path = os.path.join(central_pdf_folder, filename)
             
             # Determine the new filename with updated naming format
-            if self.enable_renaming.get():
+            if enable_renaming:
                 new_name = f"المستند رقم {doc_number:03d} - {filename}"
             else:
                 new_name = filename
                 
             dest_path = os.path.join(destination_folder, new_name)
-            
-            processed_count += 1
-            
-            # Update progress
-            self.progress['value'] = (processed_count / total_files) * 100
-            self.status_var.set(f"Processing {processed_count}/{total_files}: {new_name}")
-            self.root.update_idletasks()
-            
-            try:
-                if self.add_cover_page.get():
-                    # Create and add cover page
-                    cover_buffer = self.create_cover_page(doc_number, link_text, pdf_filename)
-                    
-                    # Merge cover page with original PDF
-                    pdf_writer = PdfWriter()
-                    
-                    # Add cover page
-                    cover_reader = PdfReader(cover_buffer)
-                    pdf_writer.add_page(cover_reader.pages[0])
-                    
-                    # Add original PDF pages
-                    original_reader = PdfReader(source_path)
-                    for page in original_reader.pages:
-                        pdf_writer.add_page(page)
-                    
-                    # Write to destination
-                    with open(dest_path, 'wb') as output_file:
-                        pdf_writer.write(output_file)
-                else:
-                    # Just copy the file if no cover page needed
-                    shutil.copy(source_path, dest_path)
-            except Exception as e:
-                logging.error(f"Error processing {source_path}: {e}")
-                # Try to copy the original as fallback
-                try:
-                    shutil.copy(source_path, dest_path)
-                except:
-                    pass
+            tasks.append((source_path, dest_path, doc_number, add_cover, skip_if_covered))
+            group_sizes.append(len(link_texts))
+        
+        total_files = len(existing_pdfs)
+        processed_count = 0
+        
+        if not add_cover:
+            # Renamed copies only, nothing CPU-bound, so threads are enough
+            source_paths = [task[0] for task in tasks]
+            dest_paths = [task[1] for task in tasks]
+            with ThreadPoolExecutor(max_workers=COPY_MAX_WORKERS) as executor:
+                results = executor.map(copy_file, source_paths, dest_paths)
+                for _, dest_path, group_size in zip(results, dest_paths, group_sizes):
+                    processed_count += group_size
+                    self.update_merge_progress(processed_count, total_files, dest_path)
+            return
+        
+        # Merge each file once in worker processes, each worker registers its own fonts
+        merged_count = 0
+        max_workers = min(len(tasks), os.cpu_count() or 1)
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=register_fonts) as executor:
+                results = executor.map(merge_pdf_task, tasks, chunksize=4)
+                for dest_path, group_size in zip(results, group_sizes):
+                    merged_count += 1
+                    processed_count += group_size
+                    self.update_merge_progress(processed_count, total_files, dest_path)
+        except BrokenProcessPool as e:
+            # A worker died (crash or out of memory), merge the files still pending in this process
+            logger.error("PDF worker process died, merging the remaining files in-process: %s", e)
+            for task, group_size in zip(tasks[merged_count:], group_sizes[merged_count:]):
+                dest_path = merge_pdf(*task)
+                processed_count += group_size
+                self.update_merge_progress(processed_count, total_files, dest_path)
+
+    def update_merge_progress(self, processed_count, total_files, dest_path):
+        """Update the progress bar and status after a PDF has been written"""
+        self.progress['value'] = (processed_count / total_files) * 100
+        self.status_var.set(f"Processing {processed_count}/{total_files}: {os.path.basename(dest_path)}")
+        self.root.update_idletasks()
 
     def copy_files_parallel(self, hyperlinks, central_pdf_folder, destination_folder):
-        """Copies PDFs in parallel using multi-threading"""
+        """Copies PDFs in parallel using a bounded thread pool"""
         os.makedirs(destination_folder, exist_ok=True)
-        threads = []
+        
+        # Map each source to its destination, so a PDF linked several times is copied once
+        copy_jobs = {}
         for _, pdf_filename in hyperlinks:
-            pdf_path = os.path.join(central_pdf_folder, os.path.basename(pdf_filename))
+            filename = os.path.basename(pdf_filename)
+            pdf_path = os.path.join(central_pdf_folder, filename)
             if os.path.exists(pdf_path):
-                thread = threading.Thread(target=self.copy_file, args=(pdf_path, destination_folder))
-                threads.append(thread)
-                thread.start()
-
-        for thread in threads:
-            thread.join()
-
-    def copy_file(self, source, destination):
-        """Copy a single file"""
-        try:
-            shutil.copy(source, destination)
-        except Exception as e:
-            logging.error(f"Error copying {source}: {e}")
+                copy_jobs[pdf_path] = os.path.join(destination_folder, filename)
+        
+        with ThreadPoolExecutor(max_workers=COPY_MAX_WORKERS) as executor:
+            list(executor.map(copy_file, copy_jobs.keys(), copy_jobs.values()))
 
     def copy_word_file(self, word_file_path, destination_folder):
         """Copies the selected Word document to the destination folder."""
@@ -581,6 +769,9 @@ class PDFExtractorApp:
 
 
 if __name__ == "__main__":
+    # Needed for the PDF worker processes when running as a frozen executable
+    multiprocessing.freeze_support()
+
     print("PDF Extractor Tool v1.0")
     print("Author: Haytham Abo Abdallah")
     print("=============================")